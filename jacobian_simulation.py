@@ -1,8 +1,9 @@
 #Authored By: Michaël Guerrier (GitHub - Token Thinker)
 # Imports
+import math
 import numpy as np
 from matplotlib import pyplot as plt, ticker
-from matplotlib.patches import Rectangle, FancyArrow
+from matplotlib.collections import PolyCollection
 from matplotlib.animation import FuncAnimation
 
 # Global parameters for robot configuration
@@ -12,9 +13,48 @@ ROBOT_RADIUS = 0.195  # Distance from the center of the robot platform to the wh
 OMEGA = 0  # Default angular velocity (rad/s)
 WHEEL_ANGLES = [np.radians(60), np.radians(180), np.radians(300)]  # Angles for a 3-wheel configuration
 F_WHEEL_ANGLES = [np.radians(45), np.radians(135), np.radians(225), np.radians(315)]  # Angles for a 4-wheel configuration
+DTYPE = np.float32  # Float type of the geometry arrays, plenty of precision for plotting
+WHEEL_ANGLES_ARR = np.asarray(WHEEL_ANGLES).astype(DTYPE)  # 3-wheel angles as an array for vectorized geometry
+F_WHEEL_ANGLES_ARR = np.asarray(F_WHEEL_ANGLES).astype(DTYPE)  # 4-wheel angles as an array for vectorized geometry
+WHEEL_COS, WHEEL_SIN = np.cos(WHEEL_ANGLES_ARR), np.sin(WHEEL_ANGLES_ARR)  # cos/sin of the 3-wheel angles
+F_WHEEL_COS, F_WHEEL_SIN = np.cos(F_WHEEL_ANGLES_ARR), np.sin(F_WHEEL_ANGLES_ARR)  # cos/sin of the 4-wheel angles
+WHEEL_OUTLINE = np.array([[0, 0], [WHEEL_RADIUS, 0], [WHEEL_RADIUS, WHEEL_WIDTH], [0, WHEEL_WIDTH]]).astype(DTYPE)  # Unrotated wheel corners
+N_FRAMES = 720  # Number of frames in one animation loop
+ANIMATION_DPI = 80  # Figure resolution for the interactive animation, fewer pixels to blit per frame
 PLOT_BOTH = False  # Flag to decide if both 3-wheel and 4-wheel configurations should be plotted
 paused = False  # Flag to manage the animation's paused state
 
+# Function to build the Jacobian matrix for a set of wheel angles
+def _build_J(angles):
+    """
+    Builds the Jacobian matrix relating the robot's body-frame velocities to the wheel velocities.
+
+    Args:
+        angles: Angles of the wheels (radians).
+
+    Returns:
+        J: Jacobian matrix with one row per wheel.
+    """
+    j = np.zeros((len(angles), 3))  # Initialize a matrix with as many rows as there are wheels
+    for i, angle in enumerate(angles):
+        j[i, 0] = math.cos(angle) / WHEEL_RADIUS  # Contribution to x-velocity
+        j[i, 1] = math.sin(angle) / WHEEL_RADIUS  # Contribution to y-velocity
+        j[i, 2] = ROBOT_RADIUS / WHEEL_RADIUS   # Contribution to rotational velocity (omega)
+    return j.astype(DTYPE)
+
+# The Jacobian only depends on the wheel configuration, so build it once per configuration
+J3 = _build_J(WHEEL_ANGLES)  # Jacobian for the 3-wheel configuration
+J4 = _build_J(F_WHEEL_ANGLES)  # Jacobian for the 4-wheel configuration
+
+# Info box template with a velocity field per wheel, built once for each wheel configuration
+_INFO_TMPL = (
+    "robot orient.={{:.1f}}°\n"
+    "driving dir={{:.1f}}°\n"
+    "driving speed (m/s) ={{:.1f}}\n"
+    "ω (rad/s) = [{}]"
+)
+_INFO_TMPLS = {n: _INFO_TMPL.format(', '.join(['{:.1f}'] * n)) for n in (len(WHEEL_ANGLES), len(F_WHEEL_ANGLES))}
+
 # Function to get user inputs or use default values
 def get_user_inputs():
     """
@@ -48,7 +88,7 @@ def get_user_inputs():
 # Function to construct the Jacobian matrix
 def construct_jacobian(use_four_wheels=False):
     """
-    Constructs the Jacobian matrix for the robot, determining the relationship between the robot's
+    Returns the Jacobian matrix for the robot, determining the relationship between the robot's
     velocities and the wheel velocities based on the wheel configuration (3 or 4 wheels).
 
     Args:
@@ -57,19 +97,15 @@ def construct_jacobian(use_four_wheels=False):
     Returns:
         J: Jacobian matrix for the selected wheel configuration.
     """
-    angles = F_WHEEL_ANGLES if use_four_wheels else WHEEL_ANGLES  # Use the appropriate wheel configuration
-    j = np.zeros((len(angles), 3))  # Initialize a matrix with as many rows as there are wheels
-    for i, angle in enumerate(angles):
-        j[i, 0] = np.cos(angle) / WHEEL_RADIUS  # Contribution to x-velocity
-        j[i, 1] = np.sin(angle) / WHEEL_RADIUS  # Contribution to y-velocity
-        j[i, 2] = ROBOT_RADIUS / WHEEL_RADIUS   # Contribution to rotational velocity (omega)
-    return j
+    return J4 if use_four_wheels else J3
 
 # Function to convert robot speed and angle to body frame velocities
 def convert_to_body_frame(speed, angle, orientation):
     """
     Converts the robot's speed and driving angle into body-frame velocities considering its orientation.
 
+    Accepts scalars or per-frame arrays.
+
     Args:
         speed: Speed of the robot.
         angle: Driving angle of the robot (degrees).
@@ -78,23 +114,17 @@ def convert_to_body_frame(speed, angle, orientation):
     Returns:
         v_bx, v_by: Body-frame x and y velocities.
     """
-    angle_rad = np.radians(angle)  # Convert driving angle to radians
-    orientation_rad = np.radians(orientation)  # Convert robot orientation to radians
-
-    # Calculate the body-frame velocities before rotating them
-    v_bx_0 = speed * np.cos(angle_rad - orientation_rad)  # Forward component
-    v_by_0 = speed * np.sin(angle_rad - orientation_rad)  # Lateral component
+    theta = np.radians(angle - orientation)  # Driving angle relative to the robot's orientation
+    s, c = np.sin(theta), np.cos(theta)
 
-    # Rotate 90 degrees to convert them to body-frame velocities
-    v_bx = -v_by_0  # x-velocity (after rotation)
-    v_by = v_bx_0   # y-velocity (after rotation)
-
-    return v_bx, v_by
+    # The body frame is rotated 90 degrees, so the forward/lateral components swap and x flips sign
+    return -speed * s, speed * c
 
 # Function to compute wheel velocities using the Jacobian model
 def compute_wheel_velocities_jacobian(speed, angle, orientation, omega, use_four_wheels=False):
     """
     Computes the angular velocities of the wheels using the robot's velocity and the Jacobian matrix.
+    Accepts scalars for a single state, or per-frame arrays for speed, angle and orientation.
 
     Args:
         speed: Speed of the robot.
@@ -104,97 +134,64 @@ def compute_wheel_velocities_jacobian(speed, angle, orientation, omega, use_four
         use_four_wheels: Boolean indicating whether to use the 4-wheel configuration.
 
     Returns:
-        wheel_velocities: Array of angular velocities for the wheels.
+        wheel_velocities: Array of angular velocities for the wheels, with one row per frame for array inputs.
     """
     v_bx, v_by = convert_to_body_frame(speed, angle, orientation)  # Convert to body-frame velocities
-    v = np.array([v_bx, v_by, omega])  # Create the velocity vector
-    j = construct_jacobian(use_four_wheels)  # Get the Jacobian matrix
-    wheel_velocities = np.dot(j, v)  # Calculate the wheel velocities
+    j = construct_jacobian(use_four_wheels)  # Get the cached Jacobian matrix
+
+    # Evaluate J @ [v_bx, v_by, omega] column by column, without building the velocity vectors
+    wheel_velocities = np.multiply.outer(v_bx, j[:, 0]) + np.multiply.outer(v_by, j[:, 1]) + j[:, 2] * omega
     return wheel_velocities
 
-# Function to plot the robot and wheels on the provided axis
-def plot_robot(ax, wheel_velocities, orientation, speed, angle, use_four_wheels=False):
+# Function to precompute the robot's state for every animation frame
+def precompute_kinematics(omega, use_four_wheels=False):
     """
-    Plots the robot's body, wheels, and velocity vectors based on the wheel velocities and orientation.
+    Computes the speed, driving angle, orientation and wheel velocities for all frames of the animation
+    at once, since they only depend on the frame number and omega.
 
     Args:
-        ax: The axis on which to plot the robot.
-        wheel_velocities: Angular velocities of the wheels.
-        orientation: Robot's orientation.
-        speed: Robot's speed.
-        angle: Driving angle.
-        use_four_wheels: Boolean indicating whether the 4-wheel configuration is used.
+        omega: Angular velocity of the robot.
+        use_four_wheels: Boolean indicating whether to use the 4-wheel configuration.
+
+    Returns:
+        kinematics: Dictionary of per-frame arrays ('speeds', 'angles', 'orientations', 'wheel_velocities').
     """
-    ax.clear()  # Clear the axis for redrawing
+    frames = np.arange(N_FRAMES).astype(DTYPE)
 
-    # Plot the robot's body as a circle
-    robot_circle = plt.Circle((0, 0), ROBOT_RADIUS, edgecolor='black', facecolor='blue', fill=True, lw=2, alpha=0.5)
-    ax.add_patch(robot_circle)
+    # Oscillate speed between 0 and 1 based on the frame number
+    speeds = 0.5 * (1 + np.sin(np.radians(frames)))
 
-    # Calculate the robot's forward position for orientation
-    orientation_rad = np.radians(orientation)
-    forward_position_x = ROBOT_RADIUS * np.cos(orientation_rad)
-    forward_position_y = ROBOT_RADIUS * np.sin(orientation_rad)
-    ax.plot(forward_position_x, forward_position_y, 'bo', label="Forward Position")
+    # Increment the driving angle from 0 to 360 degrees
+    angles = frames % 360
 
-    # Plot the direction arrow based on speed
-    if speed > 0.01:  # Only plot if speed is significant
-        sp_arrow_max = ROBOT_RADIUS * 0.90  # Maximum arrow length
-        sp_scaled = sp_arrow_max * speed
-        end_x = round(sp_scaled * np.cos(np.radians(angle)), 4)
-        end_y = round(sp_scaled * np.sin(np.radians(angle)), 4)
-        sp_arrow = FancyArrow(0, 0, end_x, end_y, width=0.01, color='white', length_includes_head=False, head_width=.02, head_length=.02)
-        ax.add_patch(sp_arrow)
+    # Change the robot's orientation based on speed and omega
+    orientations = (DTYPE(omega) * frames) % 360
 
-    # Plot wheels and wheel velocity vectors
-    wheel_angles = F_WHEEL_ANGLES if use_four_wheels else WHEEL_ANGLES
-    for i, w_angle_rad in enumerate(wheel_angles):
-        rotated_angle_rad = w_angle_rad + orientation_rad
-        x = ROBOT_RADIUS * np.cos(rotated_angle_rad)
-        y = ROBOT_RADIUS * np.sin(rotated_angle_rad)
-
-        # Calculate rectangle (wheel) position
-        rect_x = x + ((WHEEL_WIDTH / 2) * np.cos(rotated_angle_rad)) - ((WHEEL_RADIUS / 2) * np.cos(rotated_angle_rad + np.pi / 2))
-        rect_y = y + ((WHEEL_WIDTH / 2) * np.sin(rotated_angle_rad)) - ((WHEEL_RADIUS / 2) * np.sin(rotated_angle_rad + np.pi / 2))
-        wheel = Rectangle((rect_x, rect_y), WHEEL_RADIUS, WHEEL_WIDTH, angle=np.degrees(rotated_angle_rad + np.pi/2), ec='black', fc='white', fill=True)
-        ax.add_patch(wheel)
-
-        #Calculate rectangle buffer for velocity arrows
-        buffer_x = x + ((WHEEL_WIDTH / 2 + 0.01) * np.cos(rotated_angle_rad)) - ((WHEEL_RADIUS / 2 + 0.01) * np.cos(rotated_angle_rad + np.pi / 2))
-        buffer_y = y + ((WHEEL_WIDTH / 2 + 0.01) * np.sin(rotated_angle_rad)) - ((WHEEL_RADIUS / 2 + 0.01) * np.sin(rotated_angle_rad + np.pi / 2))
-
-        # Plot velocity vectors for each wheel
-        velocity_magnitude = wheel_velocities[i]
-        if abs(velocity_magnitude) >= 0.1:  # Only plot if velocity is significant
-            vm_x = buffer_x + (WHEEL_RADIUS  / 2) * np.cos(rotated_angle_rad + np.pi / 2)
-            vm_y = buffer_y + (WHEEL_RADIUS / 2) * np.sin(rotated_angle_rad + np.pi / 2)
-
-            v_arrow_max = WHEEL_RADIUS * 0.3  # Set the maximum arrow length
-            max_velocity = 6  # Max velocity for current robot parameters to normalize arrow length
-
-            # Calculate the velocity vector direction and magnitude
-            vm_scaled = (abs(velocity_magnitude) / max_velocity) * v_arrow_max
-
-            # Adjust the direction of the arrow based on the wheel velocity
-            if velocity_magnitude < 0:
-                # Flip the arrow direction for negative velocities
-                sv_x = vm_scaled * np.cos(rotated_angle_rad + np.pi / 2)
-                sv_y = vm_scaled * np.sin(rotated_angle_rad + np.pi / 2)
-            else:
-                # Normal direction for positive velocities
-                sv_x = -vm_scaled * np.cos(rotated_angle_rad + np.pi / 2)
-                sv_y = -vm_scaled * np.sin(rotated_angle_rad + np.pi / 2)
-
-            # Plot the velocity arrow for the wheel
-            ax.arrow(
-                vm_x, vm_y,
-                sv_x, sv_y,
-                head_width=0.01, head_length=0.01, fc='blue', ec='blue', lw=1
-            )
+    # Compute the wheel velocities using the Jacobian model, one row per frame
+    wheel_velocities = compute_wheel_velocities_jacobian(speeds, angles, orientations, omega, use_four_wheels)
 
-        # Label the wheels with their index
-        ax.text(x, y, str(i), fontsize=12, ha='center', va='center', color='black')
+    return {
+        'speeds': speeds,
+        'angles': angles,
+        'orientations': orientations,
+        'wheel_velocities': wheel_velocities,
+    }
+
+# Function to format axis ticks
+def format_tick(val, pos):
+    """
+    Formats an axis tick given in meters as a whole number of decimeters.
+    """
+    return '{:.0f}'.format(val * 10)
 
+# Function to configure the axis the robot is plotted on
+def configure_axis(ax):
+    """
+    Sets the axis limits, aspect ratio and ticks once, before the animation starts.
+
+    Args:
+        ax: The axis on which the robot is plotted.
+    """
     # Set axis limits and ensure aspect ratio
     ax.set_aspect('equal')
     ax.set_xlim([-0.4, 0.4])
@@ -203,36 +200,54 @@ def plot_robot(ax, wheel_velocities, orientation, speed, angle, use_four_wheels=
     # Set grid and ticks
     ax.xaxis.set_major_locator(ticker.MultipleLocator(0.1))
     ax.yaxis.set_major_locator(ticker.MultipleLocator(0.1))
-    ax.xaxis.set_major_formatter(ticker.FuncFormatter(lambda val, pos: '{:.0f}'.format(val * 10)))
-    ax.yaxis.set_major_formatter(ticker.FuncFormatter(lambda val, pos: '{:.0f}'.format(val * 10)))
+    ax.xaxis.set_major_formatter(ticker.FuncFormatter(format_tick))
+    ax.yaxis.set_major_formatter(ticker.FuncFormatter(format_tick))
 
     # Remove grid lines
-    plt.grid(False)
-
-    # Call plot_text to display velocity and robot info on the plot
-    plot_text(ax, speed, angle, orientation, wheel_velocities, use_four_wheels)
+    ax.grid(False)
 
-# Function to plot text information
-def plot_text(ax, speed, angle, orientation, wheel_velocities, use_four_wheels):
+# Function to create the robot's plot artists on the provided axis
+def init_plot(ax, use_four_wheels=False):
     """
-    Plots the text information box showing speed, direction, orientation, and wheel velocities.
-    Dynamically sets the title based on whether the robot uses 3 wheels or 4 wheels.
+    Creates the robot's body, wheels, velocity arrows and info box once, so that every animation
+    frame only has to move them instead of clearing and redrawing the whole axis.
+
+    Args:
+        ax: The axis on which to plot the robot.
+        use_four_wheels: Boolean indicating whether the 4-wheel configuration is used.
+
+    Returns:
+        artists: Dictionary of the artist handles updated by plot_robot.
     """
-    # Construct omega string for all wheels
-    w_omega_text = ', '.join([f'{v:.1f}' for v in wheel_velocities])
-
-    # Info box with robot's current state
-    info_text = (
-        f"robot orient.={orientation:.1f}°\n"
-        f"driving dir={angle:.1f}°\n"
-        f"driving speed (m/s) ={speed:.1f}\n"
-        f"ω (rad/s) = [{w_omega_text}]"
-    )
+    # Plot the robot's body as a circle
+    body = plt.Circle((0, 0), ROBOT_RADIUS, edgecolor='black', facecolor='blue', fill=True, lw=2, alpha=0.5)
+    ax.add_patch(body)
+
+    # Direction arrow based on speed, drawn as a line with a triangle head and hidden until the speed is significant.
+    # Keep it at patch level so the wheels are still drawn over its head
+    dir_line, = ax.plot([], [], color='white', lw=5, solid_capstyle='butt', markevery=[1], markersize=12, zorder=1, visible=False)
+
+    # All wheels as a single collection of rectangles, positioned on every frame by plot_robot
+    wheel_angles = F_WHEEL_ANGLES if use_four_wheels else WHEEL_ANGLES
+    wheels = PolyCollection(np.zeros((len(wheel_angles), 4, 2)), edgecolors='black', facecolors='white')
+    ax.add_collection(wheels)
 
-    # Display the info box in the top-left corner of the axis
-    ax.text(
+    # Wheel velocity arrows
+    vel_lines, labels = [], []
+    for i in range(len(wheel_angles)):
+        vel_line, = ax.plot([], [], color='blue', lw=1, markevery=[1], markersize=4, visible=False)
+        vel_lines.append(vel_line)
+
+        # Label the wheels with their index
+        labels.append(ax.text(0, 0, str(i), fontsize=12, ha='center', va='center', color='black'))
+
+    # Marker for the robot's forward position
+    fwd_marker, = ax.plot([], [], 'bo', label="Forward Position")
+
+    # Info box in the top-left corner of the axis, filled in with format_info_text
+    info_text = ax.text(
         0.05, .95,
-        info_text,
+        '',
         fontsize=12,
         bbox=dict(fc='azure', alpha=0.5),
         ha='left', va='top',
@@ -241,38 +256,166 @@ def plot_text(ax, speed, angle, orientation, wheel_velocities, use_four_wheels):
 
     # Set plot title based on wheel configuration
     title_text = 'Jacobian Omnidirectional - 4 Wheels' if use_four_wheels else 'Jacobian Omnidirectional - 3 Wheels'
-    ax.set_title(title_text, fontsize=16, fontweight='bold')
+    title = ax.set_title(title_text, fontsize=16, fontweight='bold')
+
+    # Artists that change between frames, in drawing order, for blitting
+    animated = (body, dir_line, wheels, *vel_lines, fwd_marker, *labels, info_text)
+
+    return {
+        'body': body,
+        'dir_line': dir_line,
+        'wheels': wheels,
+        'vel_lines': vel_lines,
+        'labels': labels,
+        'fwd_marker': fwd_marker,
+        'info_text': info_text,
+        'title': title,
+        'animated': animated,
+    }
+
+# Function to move the robot's artists to match the current state
+def plot_robot(artists, wheel_velocities, orientation, speed, angle, use_four_wheels=False):
+    """
+    Updates the robot's wheels and velocity vectors based on the wheel velocities and orientation.
+
+    Args:
+        artists: Artist handles created by init_plot.
+        wheel_velocities: Angular velocities of the wheels.
+        orientation: Robot's orientation.
+        speed: Robot's speed.
+        angle: Driving angle.
+        use_four_wheels: Boolean indicating whether the 4-wheel configuration is used.
+
+    Returns:
+        Tuple of the updated artists, in drawing order, for blitting.
+    """
+    # Calculate the robot's forward position for orientation
+    orientation_rad = math.radians(orientation)
+    cos_o, sin_o = math.cos(orientation_rad), math.sin(orientation_rad)
+    forward_position_x = ROBOT_RADIUS * cos_o
+    forward_position_y = ROBOT_RADIUS * sin_o
+    artists['fwd_marker'].set_data([forward_position_x], [forward_position_y])
+
+    # Update the direction arrow based on speed
+    dir_line = artists['dir_line']
+    if speed > 0.01:  # Only plot if speed is significant
+        sp_arrow_max = ROBOT_RADIUS * 0.90  # Maximum arrow length
+        sp_scaled = sp_arrow_max * speed
+        angle_rad = math.radians(angle)
+        end_x = round(sp_scaled * math.cos(angle_rad), 4)
+        end_y = round(sp_scaled * math.sin(angle_rad), 4)
+        dir_line.set_data([0, end_x], [0, end_y])
+        dir_line.set_marker((3, 0, angle - 90))  # Triangle head pointing along the driving direction
+        dir_line.set_visible(True)
+    else:
+        dir_line.set_visible(False)
+
+    # Calculate every wheel's geometry at once from the rotated wheel angles, using the angle
+    # addition identities on the precomputed wheel cos/sin so no per-wheel trig is needed
+    wheel_angles = F_WHEEL_ANGLES_ARR if use_four_wheels else WHEEL_ANGLES_ARR
+    wheel_cos, wheel_sin = (F_WHEEL_COS, F_WHEEL_SIN) if use_four_wheels else (WHEEL_COS, WHEEL_SIN)
+    c = wheel_cos * cos_o - wheel_sin * sin_o  # cos of the rotated angle
+    s = wheel_sin * cos_o + wheel_cos * sin_o  # sin of the rotated angle
+    cp, sp = -s, c  # cos/sin of the rotated angle plus 90 degrees
+    x = ROBOT_RADIUS * c
+    y = ROBOT_RADIUS * s
+
+    # Calculate rectangle (wheel) positions
+    rect_x = x + (WHEEL_WIDTH / 2) * c - (WHEEL_RADIUS / 2) * cp
+    rect_y = y + (WHEEL_WIDTH / 2) * s - (WHEEL_RADIUS / 2) * sp
+
+    # Rotate the wheel outline so its length lies along the wheel's tangent, then move it into place
+    outline_x, outline_y = WHEEL_OUTLINE[:, 0], WHEEL_OUTLINE[:, 1]
+    wheel_x = rect_x[:, None] + outline_x * cp[:, None] - outline_y * sp[:, None]
+    wheel_y = rect_y[:, None] + outline_x * sp[:, None] + outline_y * cp[:, None]
+    artists['wheels'].set_verts(np.stack((wheel_x, wheel_y), axis=-1))
+
+    # Calculate rectangle buffers for velocity arrows
+    buffer_x = x + (WHEEL_WIDTH / 2 + 0.01) * c - (WHEEL_RADIUS / 2 + 0.01) * cp
+    buffer_y = y + (WHEEL_WIDTH / 2 + 0.01) * s - (WHEEL_RADIUS / 2 + 0.01) * sp
+    vm_x = buffer_x + (WHEEL_RADIUS / 2) * cp
+    vm_y = buffer_y + (WHEEL_RADIUS / 2) * sp
+
+    v_arrow_max = WHEEL_RADIUS * 0.3  # Set the maximum arrow length
+    max_velocity = 6  # Max velocity for current robot parameters to normalize arrow length
+
+    # Scale the velocity vectors, pointing them against the wheel's tangent for positive velocities
+    vm_scaled = -(np.asarray(wheel_velocities) / max_velocity) * v_arrow_max
+    sv_x = vm_scaled * cp
+    sv_y = vm_scaled * sp
+    significant = np.abs(wheel_velocities) >= 0.1  # Only plot if velocity is significant
+
+    # Rotation of the triangle arrow heads, which point up unrotated, along +/-(cp, sp)
+    head_angle = np.degrees(wheel_angles) + orientation + np.where(vm_scaled > 0, 0, 180)
+
+    # Move the velocity arrows and wheel labels
+    for i, (vel_line, label) in enumerate(zip(artists['vel_lines'], artists['labels'])):
+        if significant[i]:
+            vel_line.set_data([vm_x[i], vm_x[i] + sv_x[i]], [vm_y[i], vm_y[i] + sv_y[i]])
+            vel_line.set_marker((3, 0, head_angle[i]))
+        vel_line.set_visible(significant[i])
+
+        label.set_position((x[i], y[i]))
+
+    # Display velocity and robot info on the plot
+    artists['info_text'].set_text(format_info_text(speed, angle, orientation, wheel_velocities))
+
+    return artists['animated']
+
+# Function to format the text information
+def format_info_text(speed, angle, orientation, wheel_velocities):
+    """
+    Formats the text for the information box showing speed, direction, orientation, and wheel velocities.
+
+    Returns:
+        info_text: Text to display in the information box.
+    """
+    # Info box with robot's current state, filled into the template for the number of wheels
+    info_text = _INFO_TMPLS[len(wheel_velocities)].format(orientation, angle, speed, *wheel_velocities)
+    return info_text
 
 # Toggle pause function
-def toggle_pause(event):
+def toggle_pause(event, ani):
     global paused
     if event.key == ' ':
         paused = not paused
 
+        # Stop or restart the animation timer, so no frames are computed while paused
+        if paused:
+            ani.pause()
+        else:
+            ani.resume()
+
 # Update function for animation frames
-def update(frame, ax, omega, use_four_wheels=False):
+def update(frame, artists, kinematics, use_four_wheels=False):
     """
-    Updates the animation by recalculating wheel velocities and plotting the robot's state.
-    The animation can be paused and resumed by toggling the 'paused' state.
-    """
-    if not paused:
-        ax.clear()
+    Updates the animation by looking up the frame's precomputed state and moving the robot's artists.
 
-        # Oscillate speed between 0 and 1 based on the frame number
-        speed = 0.5 * (1 + np.sin(np.radians(frame)))
+    Returns:
+        Tuple of the artists to redraw for this frame.
+    """
+    # matplotlib restarts the timer after a window resize, so keep the robot still while paused
+    if paused:
+        return artists['animated']
 
-        # Increment the driving angle from 0 to 360 degrees
-        angle = frame % 360
+    # Look up the robot's state for this frame
+    speed = kinematics['speeds'][frame]
+    angle = kinematics['angles'][frame]
+    orientation = kinematics['orientations'][frame]
+    wheel_velocities = kinematics['wheel_velocities'][frame]
 
-        # Change the robot's orientation based on speed and omega
-        orientation_change_rate = omega * frame
-        orientation = orientation_change_rate % 360
+    # Update the plot with the new values
+    return plot_robot(artists, wheel_velocities, orientation, speed, angle, use_four_wheels)
 
-        # Compute the wheel velocities using the Jacobian model
-        wheel_velocities = compute_wheel_velocities_jacobian(speed, angle, orientation, omega, use_four_wheels)
+# Update function for animation frames when both configurations are plotted
+def update_both(frame, artists_3w, artists_4w, kinematics_3w, kinematics_4w):
+    """
+    Updates the 3-wheel and 4-wheel plots side by side from a single animation frame.
 
-        # Update the plot with the new values
-        plot_robot(ax, wheel_velocities, orientation, speed, angle, use_four_wheels)
+    Returns:
+        Tuple of the artists of both plots to redraw for this frame.
+    """
+    return update(frame, artists_3w, kinematics_3w, False) + update(frame, artists_4w, kinematics_4w, True)
 
 # Main function to run the animation
 def run_animation():
@@ -284,25 +427,36 @@ def run_animation():
 
     if PLOT_BOTH:
         # Create a figure with two subplots for side-by-side comparison of 3-wheel and 4-wheel configurations
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8), dpi=ANIMATION_DPI)
 
         # 3-wheel configuration on the left
-        ani1 = FuncAnimation(fig, update, fargs=(ax1, OMEGA, False), frames=np.arange(0, 720, 1), interval=50, repeat=True)
+        configure_axis(ax1)
+        artists_3w = init_plot(ax1, False)
+        kinematics_3w = precompute_kinematics(OMEGA, False)
 
         # 4-wheel configuration on the right
-        ani2 = FuncAnimation(fig, update, fargs=(ax2, OMEGA, True), frames=np.arange(0, 720, 1), interval=50, repeat=True)
+        configure_axis(ax2)
+        artists_4w = init_plot(ax2, True)
+        kinematics_4w = precompute_kinematics(OMEGA, True)
+
+        # Animate both configurations in lockstep from a single animation
+        ani = FuncAnimation(fig, update_both, fargs=(artists_3w, artists_4w, kinematics_3w, kinematics_4w), frames=range(N_FRAMES), interval=50, blit=True, repeat=True)
     else:
         # Create a single plot for either 3 or 4 wheels
-        fig, ax = plt.subplots(figsize=(8, 8))
+        fig, ax = plt.subplots(figsize=(8, 8), dpi=ANIMATION_DPI)
 
         # Animate the selected configuration
-        ani = FuncAnimation(fig, update, fargs=(ax, OMEGA, use_four_wheels), frames=np.arange(0, 720, 1), interval=50, repeat=True)
+        configure_axis(ax)
+        artists = init_plot(ax, use_four_wheels)
+        kinematics = precompute_kinematics(OMEGA, use_four_wheels)
+        ani = FuncAnimation(fig, update, fargs=(artists, kinematics, use_four_wheels), frames=range(N_FRAMES), interval=50, blit=True, repeat=True)
 
     # Connect the pause functionality to the figure (spacebar to pause)
-    fig.canvas.mpl_connect('key_press_event', toggle_pause)
+    fig.canvas.mpl_connect('key_press_event', lambda event: toggle_pause(event, ani))
 
     # Show the plot
     plt.show()
 
-# Run the animation
-run_animation()
\ No newline at end of file
+# Run the animation when executed as a script
+if __name__ == "__main__":
+    run_animation()